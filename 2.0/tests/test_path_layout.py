@@ -0,0 +1,87 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path, PurePosixPath
+
+try:
+    import PyQt5   # noqa: F401  (o script importa PyQt5 ao carregar)
+except ImportError:
+    PyQt5 = None
+
+VERSAO = "Windows Version" if sys.platform == "win32" else "Linux Version"
+SCRIPT = Path(__file__).resolve().parent.parent / VERSAO / "WorkFlowManager2.0.py"
+
+
+def carregar_script():
+    spec = importlib.util.spec_from_file_location("workflow_manager", SCRIPT)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+@unittest.skipIf(PyQt5 is None, "PyQt5 não instalado")
+class PathLayoutTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.wfm = carregar_script()
+        cls.base = PurePosixPath("/srv/Projetos")
+
+    def projeto(self, *campos):
+        return self.wfm.Projeto(*campos)
+
+    def test_ida_e_volta_padrao(self):
+        layout = self.wfm.PathLayout()
+        caminho = layout.format(self.base, 2026, "Clientes", 3, "Ana", "obra/planta")
+        self.assertEqual(caminho, self.base / "2026" / "Clientes" / "Março" / "Ana" / "obra" / "planta")
+        self.assertEqual(layout.parse(caminho, self.base), self.projeto(2026, "Clientes", 3, "Ana", "obra/planta"))
+
+    def test_subpastas_vazias(self):
+        layout = self.wfm.PathLayout()
+        caminho = layout.format(self.base, 2026, "Outros", 12, "Bruno", "")
+        self.assertEqual(caminho, self.base / "2026" / "Outros" / "Dezembro" / "Bruno")
+        self.assertEqual(layout.parse(caminho, self.base), self.projeto(2026, "Outros", 12, "Bruno", ""))
+
+    def test_separadores_do_windows(self):
+        layout = self.wfm.PathLayout()
+        caminho = layout.format(self.base, 2026, "Clientes", 1, "Ana", "obra\\planta")
+        self.assertEqual(caminho, self.base / "2026" / "Clientes" / "Janeiro" / "Ana" / "obra" / "planta")
+        self.assertEqual(layout.parse(r"C:\Projetos\2026\Clientes\Janeiro\Ana\obra", r"C:\Projetos"),
+                         self.projeto(2026, "Clientes", 1, "Ana", "obra"))
+
+    def test_fora_da_base_ou_do_esquema(self):
+        layout = self.wfm.PathLayout()
+        self.assertIsNone(layout.parse("/outro/2026/Clientes/Março/Ana", self.base))
+        self.assertIsNone(layout.parse(self.base / "2026" / "Fornecedores" / "Março" / "Ana", self.base))
+        self.assertIsNone(layout.parse(self.base / "2026" / "Clientes", self.base))
+
+    def test_parse_many_igual_a_parse(self):
+        layout = self.wfm.PathLayout()
+        caminhos = [layout.format(self.base, 2025, "Clientes", mes, f"C{mes}") for mes in range(1, 13)]
+        caminhos.append("/outro/lugar")
+        self.assertEqual(list(layout.parse_many(caminhos, self.base)),
+                         [layout.parse(c, self.base) for c in caminhos])
+
+    def test_esquema_personalizado(self):
+        layout = self.wfm.PathLayout("{cliente}/{ano}-{mes}/{subpastas*}")
+        caminho = layout.format(self.base, 2026, "Clientes", 5, "Ana", "a/b")
+        self.assertEqual(caminho, self.base / "Ana" / "2026-Maio" / "a" / "b")
+        self.assertEqual(layout.parse(caminho, self.base), self.projeto(2026, None, 5, "Ana", "a/b"))
+        self.assertEqual(layout.clients_folder(self.base, 2026, "Clientes", 5), self.base)
+        with self.assertRaises(ValueError):
+            self.wfm.PathLayout("{ano}/{cliente}-{mes}").clients_folder(self.base, 2026, "Clientes", 5)
+
+    def test_pasta_dos_clientes(self):
+        layout = self.wfm.PathLayout()
+        self.assertEqual(layout.clients_folder(self.base, 2026, "Clientes", 2),
+                         self.base / "2026" / "Clientes" / "Fevereiro")
+
+    def test_esquemas_invalidos(self):
+        for esquema in ("{ano}/{desconhecido}", "{ano}/{ano}", "{subpastas*}/{ano}", "{ano", "", None,
+                        "{cliente}/{cliente*}"):
+            with self.subTest(esquema=esquema), self.assertRaises(ValueError):
+                self.wfm.PathLayout(esquema)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from webdav_standin import StandInServer
+
+try:
+    import PyQt5   # noqa: F401  (o script importa PyQt5 ao carregar)
+except ImportError:
+    PyQt5 = None
+
+VERSAO = "Windows Version" if sys.platform == "win32" else "Linux Version"
+SCRIPT = Path(__file__).resolve().parent.parent / VERSAO / "WorkFlowManager2.0.py"
+
+
+def carregar_script():
+    spec = importlib.util.spec_from_file_location("workflow_manager", SCRIPT)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+@unittest.skipIf(PyQt5 is None, "PyQt5 não instalado")
+class WebDAVBackendTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.wfm = carregar_script()
+
+    def setUp(self):
+        self.raiz = tempfile.TemporaryDirectory()
+        self.local = tempfile.TemporaryDirectory()
+        # Credenciais isoladas por teste: nem o cofre real do desenvolvedor nem um arquivo compartilhado
+        self.credenciais = os.path.join(self.local.name, "credenciais.json")
+        for nome, valor in (("keyring", None), ("CREDENTIALS_FILE", self.credenciais)):
+            patcher = mock.patch.object(self.wfm, nome, valor)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.servidor = StandInServer(self.raiz.name).start()
+        self.backend = self.wfm.WebDAVBackend(self.servidor.url)
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.raiz.cleanup()
+        self.local.cleanup()
+
+    def arquivo_local(self, nome, dados):
+        caminho = os.path.join(self.local.name, nome)
+        with open(caminho, "wb") as f:
+            f.write(dados)
+        return caminho
+
+    def test_mkdir_upload_listdir(self):
+        pasta = self.backend.path("/Projetos/2026/Clientes")
+        self.backend.mkdir(pasta)
+        self.backend.upload(self.arquivo_local("a.skp", b"x" * 100), pasta / "a.skp")
+        entradas = self.backend.listdir(pasta)
+        self.assertEqual([(e.nome, e.is_dir, e.tamanho) for e in entradas], [("a.skp", False, 100)])
+        self.assertTrue(self.backend.exists(pasta / "a.skp"))
+        self.assertFalse(self.backend.exists(pasta / "b.skp"))
+
+    def test_download_e_read_head(self):
+        dados = os.urandom(3 * self.wfm.WebDAVBackend.CHUNK + 17)
+        self.backend.upload(self.arquivo_local("m.skp", dados), self.backend.path("/m.skp"))
+        destino = os.path.join(self.local.name, "baixado.skp")
+        self.backend.download(self.backend.path("/m.skp"), destino)
+        with open(destino, "rb") as f:
+            self.assertEqual(f.read(), dados)
+        self.assertEqual(self.backend.read_head(self.backend.path("/m.skp"), 10), dados[:10])
+
+    def test_download_refeito_apos_reset_nao_corrompe(self):
+        dados = os.urandom(5 * 1024 * 1024)
+        self.backend.upload(self.arquivo_local("grande.skp", dados), self.backend.path("/grande.skp"))
+        self.servidor.resets.add("/grande.skp")
+        destino = os.path.join(self.local.name, "grande_baixado.skp")
+        self.backend.download(self.backend.path("/grande.skp"), destino)
+        with open(destino, "rb") as f:
+            self.assertEqual(f.read(), dados)
+
+    def test_checkpoint_a_cada_bloco(self):
+        dados = os.urandom(3 * self.wfm.WebDAVBackend.CHUNK + 17)
+        enviados, recebidos = [], []
+        self.backend.upload(self.arquivo_local("c.skp", dados), self.backend.path("/c.skp"), enviados.append)
+        destino = os.path.join(self.local.name, "c_baixado.skp")
+        self.backend.download(self.backend.path("/c.skp"), destino, recebidos.append)
+        self.assertEqual(sum(enviados), len(dados))
+        self.assertEqual(sum(recebidos), len(dados))
+        self.assertGreater(len(recebidos), 1)
+
+    def test_copy_rename_rmtree(self):
+        self.backend.mkdir(self.backend.path("/A/sub"))
+        self.backend.upload(self.arquivo_local("f.txt", b"abc"), self.backend.path("/A/sub/f.txt"))
+        self.backend.copy(self.backend.path("/A/sub/f.txt"), self.backend.path("/A/g.txt"))
+        self.backend.rename(self.backend.path("/A"), self.backend.path("/B"))
+        self.assertFalse(self.backend.exists(self.backend.path("/A")))
+        self.assertEqual(sorted(e.nome for e in self.backend.listdir(self.backend.path("/B"))), ["g.txt", "sub"])
+        with self.assertRaises(FileExistsError):
+            self.backend.mkdir(self.backend.path("/C"))
+            self.backend.rename(self.backend.path("/B"), self.backend.path("/C"))
+        self.backend.rmtree(self.backend.path("/B"))
+        self.assertFalse(self.backend.exists(self.backend.path("/B")))
+
+    def test_spec_sem_credenciais(self):
+        url = self.servidor.url.replace("http://", "http://operador:s3nha@")
+        backend = self.wfm.get_backend({"tipo": "webdav", "url": url})
+        self.assertEqual(backend.spec(), {"tipo": "webdav", "url": self.servidor.url})
+        self.assertNotIn("s3nha", str(backend.spec()))
+        # Sem a senha no spec, uma nova instância recupera as credenciais guardadas
+        self.assertEqual(self.wfm.WebDAVBackend(self.servidor.url).auth, backend.auth)
+        self.assertEqual(self.wfm.load_credentials(self.servidor.url), ("operador", "s3nha"))
+
+    def test_credenciais_sem_cofre_utilizavel(self):
+        class SemCofre(Exception):
+            pass
+
+        def falha(*args):
+            raise SemCofre("nenhum backend de keyring")
+
+        cofre = mock.Mock(get_password=falha, set_password=falha)
+        with mock.patch.object(self.wfm, "keyring", cofre), \
+                mock.patch.object(self.wfm, "KeyringError", SemCofre, create=True):
+            self.wfm.save_credentials(self.servidor.url, "operador", "s3nha")
+            self.assertEqual(self.wfm.load_credentials(self.servidor.url), ("operador", "s3nha"))
+        if os.name == "posix":
+            self.assertEqual(os.stat(self.credenciais).st_mode & 0o777, 0o600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Servidor WebDAV mínimo, em memória de disco local, para testar o WebDAVBackend.
+
+Atende PROPFIND (Depth 0/1), MKCOL, GET (com Range), PUT, COPY, MOVE e DELETE sobre uma
+pasta local. Falhas de rede podem ser simuladas: cada caminho em `resets` tem a conexão
+derrubada (RST) no meio do próximo GET.
+"""
+
+import os
+import shutil
+import socket
+import struct
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def local(self, caminho=None):
+        return os.path.join(self.server.raiz, unquote(urlsplit(caminho or self.path).path).lstrip("/"))
+
+    def responder(self, status, corpo=b"", tipo="text/plain"):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.send_header("Content-Type", tipo)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def ler_corpo(self):
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_PROPFIND(self):
+        self.ler_corpo()
+        alvo = self.local()
+        if not os.path.exists(alvo):
+            return self.responder(404)
+        href = urlsplit(self.path).path
+        itens = [(href, alvo)]
+        if os.path.isdir(alvo) and self.headers.get("Depth") == "1":
+            itens += [(href.rstrip("/") + "/" + quote(nome), os.path.join(alvo, nome)) for nome in os.listdir(alvo)]
+        partes = ['<?xml version="1.0"?><d:multistatus xmlns:d="DAV:">']
+        for href, caminho in itens:
+            st, pasta = os.stat(caminho), os.path.isdir(caminho)
+            partes.append(f'<d:response><d:href>{escape(href)}</d:href><d:propstat><d:prop>'
+                          f'<d:resourcetype>{"<d:collection/>" if pasta else ""}</d:resourcetype>'
+                          f'<d:getcontentlength>{0 if pasta else st.st_size}</d:getcontentlength>'
+                          f'<d:getlastmodified>{formatdate(st.st_mtime, usegmt=True)}</d:getlastmodified>'
+                          f'</d:prop></d:propstat></d:response>')
+        partes.append("</d:multistatus>")
+        self.responder(207, "".join(partes).encode(), "application/xml")
+
+    def do_MKCOL(self):
+        alvo = self.local()
+        if os.path.exists(alvo):
+            return self.responder(405)
+        os.mkdir(alvo)
+        self.responder(201)
+
+    def do_GET(self):
+        alvo = self.local()
+        if not os.path.isfile(alvo):
+            return self.responder(404)
+        with open(alvo, "rb") as f:
+            dados = f.read()
+        intervalo = self.headers.get("Range")
+        if intervalo:
+            inicio, fim = intervalo.split("=")[1].split("-")
+            return self.responder(206, dados[int(inicio):int(fim) + 1], "application/octet-stream")
+        caminho = unquote(urlsplit(self.path).path)
+        if caminho in self.server.resets:
+            self.server.resets.discard(caminho)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados[:len(dados) // 2])
+            self.wfile.flush()
+            time.sleep(0.2)   # o cliente chega a gravar parte do corpo antes do reset
+            # SO_LINGER zerado: o close() envia RST em vez de FIN
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            self.connection.close()
+            self.close_connection = True
+            return
+        self.responder(200, dados, "application/octet-stream")
+
+    def do_PUT(self):
+        alvo = self.local()
+        existia = os.path.exists(alvo)
+        with open(alvo, "wb") as f:
+            f.write(self.ler_corpo())
+        self.responder(204 if existia else 201)
+
+    def do_COPY(self):
+        alvo, destino = self.local(), self.local(self.headers["Destination"])
+        if not os.path.exists(alvo):
+            return self.responder(404)
+        existia = os.path.exists(destino)
+        shutil.copy2(alvo, destino)
+        self.responder(204 if existia else 201)
+
+    def do_MOVE(self):
+        alvo, destino = self.local(), self.local(self.headers["Destination"])
+        if not os.path.exists(alvo):
+            return self.responder(404)
+        if os.path.exists(destino) and self.headers.get("Overwrite") == "F":
+            return self.responder(412)
+        os.rename(alvo, destino)
+        self.responder(201)
+
+    def do_DELETE(self):
+        alvo = self.local()
+        if not os.path.exists(alvo):
+            return self.responder(404)
+        shutil.rmtree(alvo) if os.path.isdir(alvo) else os.remove(alvo)
+        self.responder(204)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, raiz):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.raiz = raiz
+        self.resets = set()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self